@@ -0,0 +1,247 @@
+import os
+import signal
+import threading
+import multiprocessing
+from music_player import MusicPlayer
+
+TRACK_PATH_SIZE = 512  # Bytes reserved in shared memory for the current song path
+COMMAND_POLL_INTERVAL = 0.02  # Seconds the audio process waits for a command per loop
+
+
+class AudioStatus:
+    """Playback status shared between the audio and UI processes
+
+    Volume is read by the audio process. Position, pause state and track are
+    published for UI screens through AudioProcess's accessors, but nothing in
+    main.py reads them yet.
+    """
+
+    def __init__(self, ctx):
+        # Written by the audio process
+        self.position = ctx.Value('d', 0.0)
+        self.is_paused = ctx.Value('b', False)
+        self.track = ctx.Array('c', TRACK_PATH_SIZE)
+        # Written by the UI process
+        self.volume = ctx.Value('d', 0.5)
+
+
+class _EventSender:
+    """Stands in for LCDManager in the audio process, forwarding updates to the UI"""
+
+    def __init__(self, conn, lock, session):
+        self.conn = conn
+        self.lock = lock
+        self.session = session
+
+    def send(self, event, *args):
+        with self.lock:
+            self.conn.send((event, self.session) + args)
+
+    def display_now_playing(self, metadata):
+        self.send('now_playing', metadata)
+
+    def end(self):
+        self.send('music_end')
+
+
+# On Linux, sched_setaffinity/sched_setscheduler with pid 0 only change the
+# calling thread, and new threads inherit their creator's settings. That lets
+# us give SDL's audio thread a dedicated core and SCHED_FIFO without putting
+# the Python threads (command loop, metadata and seek index building) there too.
+
+def default_audio_core():
+    """Pick the highest CPU this process may run on, or None if there's only one"""
+    try:
+        cpus = os.sched_getaffinity(0)
+    except AttributeError:
+        return None
+    return max(cpus) if len(cpus) > 1 else None
+
+
+def _set_realtime(cpu_core, realtime_priority):
+    """Pin the calling thread to a core and raise its scheduling priority if possible"""
+    if cpu_core is not None:
+        try:
+            os.sched_setaffinity(0, {cpu_core})
+            print(f"DEBUG: Audio thread pinned to CPU {cpu_core}")
+        except (OSError, AttributeError) as e:
+            print(f"DEBUG: Could not pin audio thread to CPU {cpu_core}: {e}")
+    if realtime_priority is not None:
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(realtime_priority))
+            print(f"DEBUG: Audio thread running with SCHED_FIFO priority {realtime_priority}")
+        except (OSError, AttributeError) as e:
+            print(f"DEBUG: Could not raise audio thread priority: {e}")
+
+
+def _set_normal(cpus):
+    """Return the calling thread to SCHED_OTHER on its original set of cores"""
+    try:
+        os.sched_setscheduler(0, os.SCHED_OTHER, os.sched_param(0))
+        if cpus is not None:
+            os.sched_setaffinity(0, cpus)
+    except (OSError, AttributeError) as e:
+        print(f"DEBUG: Could not restore normal scheduling: {e}")
+
+
+def _run_audio_process(command_conn, event_conn, status, cpu_core, realtime_priority):
+    """Entry point of the audio process: owns the mixer and MusicPlayer"""
+    # The UI process decides when to shut down, so ignore Ctrl+C here
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    try:
+        cpus = os.sched_getaffinity(0)
+    except AttributeError:
+        cpus = None
+    # Raise priority only while the mixer starts, so that SDL's audio thread
+    # inherits it, then drop back so Python work can't compete with it
+    _set_realtime(cpu_core, realtime_priority)
+    send_lock = threading.Lock()
+    try:
+        # End events are sent per playlist so they carry that playlist's session
+        player = MusicPlayer(None)
+    finally:
+        _set_normal(cpus)
+    applied_volume = None
+
+    while True:
+        try:
+            if command_conn.poll(COMMAND_POLL_INTERVAL):
+                command, *args = command_conn.recv()
+                if command == 'shutdown':
+                    break
+                elif command == 'play_playlist':
+                    playlist_path, session = args
+                    events = _EventSender(event_conn, send_lock, session)
+                    player.play_playlist(playlist_path, events, events.end)
+                elif command == 'seek':
+                    player.seek(*args)
+                elif command in ('toggle_play_pause', 'rewind_song', 'skip_song', 'stop'):
+                    getattr(player, command)()
+                else:
+                    print(f"DEBUG: Unknown audio command: {command}")
+        except EOFError:
+            print("DEBUG: UI process went away - stopping audio process")
+            break
+        except Exception as e:
+            print(f"ERROR in audio process: {e}")
+
+        volume = status.volume.value
+        if volume != applied_volume:
+            player.set_volume(volume)
+            applied_volume = volume
+
+        status.position.value = player.get_position() if player.current_song else 0.0
+        status.is_paused.value = player.is_paused
+        status.track.value = (player.current_song or "").encode()[:TRACK_PATH_SIZE - 1]
+
+    player.stop()
+    player.shutdown()
+
+
+class AudioProcess:
+    """Runs MusicPlayer in its own process so UI stalls cannot starve playback
+
+    Exposes the same controls as MusicPlayer. Commands go over a pipe, status is
+    read from shared memory, and now-playing/end-of-playlist events come back on
+    a second pipe and are handled on a listener thread in the UI process.
+    """
+
+    def __init__(self, on_music_end_callback, cpu_core=None, realtime_priority=None):
+        self.on_music_end_callback = on_music_end_callback
+        self.lcd_manager = None  # LCD to update when a new song starts
+        self.session = 0  # Bumped on play/stop so late events from old playlists are dropped
+        self.command_lock = threading.Lock()
+
+        # Spawn rather than fork so the audio process doesn't inherit GPIO/LCD state
+        ctx = multiprocessing.get_context("spawn")
+        self.status = AudioStatus(ctx)
+        command_recv, self.command_conn = ctx.Pipe(duplex=False)
+        self.event_conn, event_send = ctx.Pipe(duplex=False)
+        self.process = ctx.Process(
+            target=_run_audio_process,
+            args=(command_recv, event_send, self.status, cpu_core, realtime_priority),
+            daemon=True,
+        )
+        self.process.start()
+        command_recv.close()
+        event_send.close()
+
+        self.event_thread = threading.Thread(target=self._handle_events)
+        self.event_thread.daemon = True
+        self.event_thread.start()
+
+    def _send(self, command, *args):
+        with self.command_lock:
+            try:
+                self.command_conn.send((command,) + args)
+            except (OSError, ValueError) as e:
+                print(f"ERROR: Could not send '{command}' to audio process: {e}")
+
+    def _handle_events(self):
+        """Apply events from the audio process to the UI"""
+        while True:
+            try:
+                event, session, *args = self.event_conn.recv()
+            except (EOFError, OSError):
+                print("DEBUG: Audio process event channel closed")
+                return
+            if session != self.session:
+                continue  # Event from a playlist that has since been stopped or replaced
+            try:
+                if event == 'now_playing' and self.lcd_manager:
+                    self.lcd_manager.display_now_playing(*args)
+                elif event == 'music_end':
+                    self.on_music_end_callback()
+            except Exception as e:
+                print(f"ERROR handling audio event '{event}': {e}")
+
+    def play_playlist(self, playlist_path, lcd_manager):
+        """Starts playing a playlist in the audio process"""
+        self.lcd_manager = lcd_manager
+        self.session += 1
+        self._send('play_playlist', playlist_path, self.session)
+
+    def toggle_play_pause(self):
+        self._send('toggle_play_pause')
+
+    def rewind_song(self):
+        self._send('rewind_song')
+
+    def skip_song(self):
+        self._send('skip_song')
+
+    def seek(self, delta):
+        self._send('seek', delta)
+
+    def stop(self):
+        self.session += 1
+        self._send('stop')
+
+    def set_volume(self, volume):
+        """Set the playback volume (0.0 to 1.0); applied by the audio process"""
+        self.status.volume.value = volume
+
+    def get_volume(self):
+        return self.status.volume.value
+
+    def get_position(self):
+        """Return the playback position in the current song in seconds"""
+        return self.status.position.value
+
+    @property
+    def is_paused(self):
+        return bool(self.status.is_paused.value)
+
+    @property
+    def current_song(self):
+        # The path is truncated to fit shared memory, which may split a character
+        return self.status.track.value.decode(errors="replace") or None
+
+    def shutdown(self):
+        """Stop the audio process and wait for it to exit"""
+        self._send('shutdown')
+        self.process.join(timeout=2)
+        if self.process.is_alive():
+            print("DEBUG: Audio process did not exit - terminating")
+            self.process.terminate()
+            self.process.join(timeout=1)
@@ -1,4 +1,3 @@
-import pygame
 import os
 import random
 import time
@@ -6,21 +5,26 @@ import signal
 import sys
 import threading
 from gpiozero import Button
-from music_player import MusicPlayer
+from audio_process import AudioProcess, default_audio_core
 from lcd_manager import LCDManager
 from playlist_manager import PlaylistManager
 from volume_control import VolumeControl
 from time import sleep
 
+# Reserve the last core we're allowed on (taskset/cpusets) for the audio thread
+AUDIO_CPU_CORE = default_audio_core()
+AUDIO_RT_PRIORITY = 10  # SCHED_FIFO priority for the audio thread (needs CAP_SYS_NICE)
+
 class MusicPlayerSystem:
     def __init__(self):
-        # Initialize pygame mixer
-        pygame.mixer.init()
+        # Playback runs in its own process, which owns the pygame mixer, so
+        # slow LCD/GPIO work here can't cause audio dropouts
+        # Pass `self.on_music_end` as the callback when creating the player
+        self.music_player = AudioProcess(self.on_music_end, cpu_core=AUDIO_CPU_CORE,
+                                         realtime_priority=AUDIO_RT_PRIORITY)
         self.lcd_manager = LCDManager()
         self.playlist_manager = PlaylistManager()
-        self.volume_control = VolumeControl()
-        # Pass `self.on_music_end` as the callback when creating MusicPlayer
-        self.music_player = MusicPlayer(self.on_music_end)
+        self.volume_control = VolumeControl(volume_setter=self.music_player.set_volume)
 
         # Set up buttons with debouncing
         self.up_button = Button(21, bounce_time=0.15)  # Further increased debounce time
@@ -30,6 +34,15 @@ class MusicPlayerSystem:
         self.select_button = Button(19, bounce_time=0.1)
         self.set_button = Button(0, bounce_time=0.15)
 
+        # Holding left/right during playback scrubs through the track
+        self.left_button.hold_time = 0.5
+        self.left_button.hold_repeat = True
+        self.right_button.hold_time = 0.5
+        self.right_button.hold_repeat = True
+        self.scrub_step = 5  # Seconds to jump per hold repeat
+        self.left_scrubbed = False  # Whether the current left press turned into a scrub
+        self.right_scrubbed = False
+
         # Button press lock to prevent multiple rapid presses
         self.button_lock = threading.Lock()
         self.last_press_time = 0
@@ -77,6 +90,10 @@ class MusicPlayerSystem:
         self.select_button.when_pressed = self.handle_select_button
         self.left_button.when_pressed = self.handle_left_button
         self.right_button.when_pressed = self.handle_right_button
+        self.left_button.when_held = self.handle_left_held
+        self.right_button.when_held = self.handle_right_held
+        self.left_button.when_released = self.handle_left_released
+        self.right_button.when_released = self.handle_right_released
 
 
     def return_to_menu(self):
@@ -184,25 +201,61 @@ class MusicPlayerSystem:
 
 
     def handle_left_button(self):
+        self.left_scrubbed = False
+        if self.state == "playback":
+            # Rewind happens on release so that a hold can scrub instead
+            return
         if not self.is_button_press_valid():
             return
         
         if self.state == "menu" or self.state == "bluetooth":
             # Return to home screen from menu or bluetooth
             self.return_to_home()
-        elif self.state == "playback":
-            self.music_player.rewind_song()
 
 
     def handle_right_button(self):
+        self.right_scrubbed = False
+        if self.state == "playback":
+            # Skip happens on release so that a hold can scrub instead
+            return
         if not self.is_button_press_valid():
             return
         
         if self.state == "menu" or self.state == "bluetooth":
             # Return to home screen from menu or bluetooth
             self.return_to_home()
-        elif self.state == "playback":
-            self.music_player.skip_song()
+
+
+    def handle_left_held(self):
+        """Scrub backward while left is held during playback"""
+        if self.state == "playback":
+            self.left_scrubbed = True
+            self.music_player.seek(-self.scrub_step)
+
+
+    def handle_right_held(self):
+        """Scrub forward while right is held during playback"""
+        if self.state == "playback":
+            self.right_scrubbed = True
+            self.music_player.seek(self.scrub_step)
+
+
+    def handle_left_released(self):
+        """Rewind on a short left press during playback"""
+        if self.state != "playback" or self.left_scrubbed:
+            return
+        if not self.is_button_press_valid():
+            return
+        self.music_player.rewind_song()
+
+
+    def handle_right_released(self):
+        """Skip on a short right press during playback"""
+        if self.state != "playback" or self.right_scrubbed:
+            return
+        if not self.is_button_press_valid():
+            return
+        self.music_player.skip_song()
 
 
     def on_music_end(self):
@@ -214,6 +267,7 @@ class MusicPlayerSystem:
         """Clean up and exit safely"""
         try:
             self.music_player.stop()
+            self.music_player.shutdown()
             self.volume_control.cleanup()
             self.lcd_manager.clear()
         except Exception as e:
@@ -0,0 +1,200 @@
+import os
+
+# Bitrates in kbps, indexed by [MPEG-1?][layer][bitrate index]
+BITRATES = {
+    True: {
+        1: [0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448],
+        2: [0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384],
+        3: [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    },
+    False: {
+        1: [0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256],
+        2: [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+        3: [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+    },
+}
+
+# Sample rates indexed by version bits (0 = MPEG-2.5, 2 = MPEG-2, 3 = MPEG-1)
+SAMPLE_RATES = {
+    0: [11025, 12000, 8000],
+    2: [22050, 24000, 16000],
+    3: [44100, 48000, 32000],
+}
+
+SCAN_RESOLUTION = 0.5  # Seconds between index points for header-only scans
+SYNC_SEARCH_LIMIT = 65536  # Max bytes to search when looking for a frame header
+
+
+def parse_frame_header(data):
+    """Decode a 4-byte MPEG audio frame header, or return None if invalid"""
+    if len(data) < 4:
+        return None
+    header = int.from_bytes(data[:4], "big")
+    if (header >> 21) & 0x7FF != 0x7FF:
+        return None
+
+    version_bits = (header >> 19) & 0x3
+    layer_bits = (header >> 17) & 0x3
+    bitrate_index = (header >> 12) & 0xF
+    sample_rate_index = (header >> 10) & 0x3
+    if version_bits == 1 or layer_bits == 0 or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+
+    mpeg1 = version_bits == 3
+    layer = 4 - layer_bits
+    bitrate = BITRATES[mpeg1][layer][bitrate_index] * 1000
+    sample_rate = SAMPLE_RATES[version_bits][sample_rate_index]
+    padding = (header >> 9) & 0x1
+    mono = ((header >> 6) & 0x3) == 3
+
+    if layer == 1:
+        samples = 384
+        length = (12 * bitrate // sample_rate + padding) * 4
+    else:
+        samples = 1152 if (layer == 2 or mpeg1) else 576
+        length = samples // 8 * bitrate // sample_rate + padding
+
+    return {
+        'mpeg1': mpeg1,
+        'layer': layer,
+        'sample_rate': sample_rate,
+        'samples': samples,
+        'length': length,
+        'mono': mono,
+    }
+
+
+def _read_header(f, offset):
+    """Read and decode the frame header at a byte offset"""
+    f.seek(offset)
+    return parse_frame_header(f.read(4))
+
+
+def _skip_id3v2(f):
+    """Return the byte offset just past a leading ID3v2 tag (0 if none)"""
+    f.seek(0)
+    tag = f.read(10)
+    if len(tag) < 10 or tag[:3] != b"ID3":
+        return 0
+    size = (tag[6] << 21) | (tag[7] << 14) | (tag[8] << 7) | tag[9]
+    footer = 10 if tag[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def find_frame(f, offset, limit=SYNC_SEARCH_LIMIT):
+    """Find the first frame at or after offset whose successor is also a valid frame"""
+    f.seek(offset)
+    data = f.read(limit)
+    i = data.find(b"\xff")
+    while i != -1:
+        frame = parse_frame_header(data[i:i + 4])
+        if frame:
+            next_offset = offset + i + frame['length']
+            f.seek(next_offset)
+            following = f.read(4)
+            # A frame running right up to EOF (or a trailing tag) is still valid
+            if len(following) < 4 or following[:3] == b"TAG" or parse_frame_header(following):
+                return offset + i
+        i = data.find(b"\xff", i + 1)
+    return None
+
+
+class SeekIndex:
+    """Maps playback time to MP3 frame byte offsets so seeks are a single lookup"""
+
+    def __init__(self, path, offsets, times, resolution, duration, complete):
+        self.path = path
+        self.offsets = offsets  # offsets[i] is the first frame starting at or after i * resolution
+        self.times = times  # times[i] is when the frame at offsets[i] starts playing
+        self.resolution = resolution
+        self.duration = duration
+        self.complete = complete  # False if the scan gave up before the end of the file
+
+    @classmethod
+    def from_file(cls, path):
+        """Build an index with a single header-only scan of the file
+
+        Xing/VBRI TOCs are not used: their entries are quantised to 1/256 of
+        the file, so they can't tell us when the frame we land on starts.
+        """
+        try:
+            with open(path, "rb") as f:
+                first = find_frame(f, _skip_id3v2(f))
+                if first is None:
+                    print(f"DEBUG: No MPEG frames found in {path}")
+                    return None
+                index = cls._from_scan(path, f, first)
+        except Exception as e:
+            print(f"DEBUG: Error building seek index for {path}: {e}")
+            return None
+
+        if index is not None:
+            print(f"DEBUG: Seek index for {os.path.basename(path)}: "
+                  f"{len(index.offsets)} points, {index.duration:.1f}s")
+        return index
+
+    @classmethod
+    def _from_scan(cls, path, f, first):
+        """Walk frame headers once, recording an offset every SCAN_RESOLUTION seconds
+
+        Junk between frames (corruption, embedded tags) is skipped by resyncing
+        on the next valid frame. The scan ends at EOF, an ID3v1 trailer, or
+        when no further frame can be found.
+        """
+        size = os.fstat(f.fileno()).st_size
+        offsets = []
+        times = []
+        elapsed = 0.0
+        next_mark = 0.0
+        pos = first
+        complete = True
+        while True:
+            f.seek(pos)
+            data = f.read(4)
+            if len(data) < 4 or data[:3] == b"TAG":
+                break
+            frame = parse_frame_header(data)
+            if frame is None:
+                resync = cls._resync(f, pos, size)
+                if resync is None:
+                    print(f"DEBUG: Lost frame sync at byte {pos} of {size}")
+                    complete = False
+                    break
+                pos = resync
+                continue
+            if elapsed >= next_mark:
+                offsets.append(pos)
+                times.append(elapsed)
+                next_mark += SCAN_RESOLUTION
+            elapsed += frame['samples'] / frame['sample_rate']
+            pos += frame['length']
+
+        if not offsets:
+            return None
+        return cls(path, offsets, times, SCAN_RESOLUTION, elapsed, complete)
+
+    @staticmethod
+    def _resync(f, pos, size):
+        """Search forward from pos, window by window, for the next valid frame"""
+        while pos < size:
+            found = find_frame(f, pos)
+            if found is not None:
+                return found
+            pos += SYNC_SEARCH_LIMIT - 3  # Overlap windows so a header can't straddle them
+        return None
+
+    def lookup(self, seconds):
+        """Return (byte offset, real start time) of the index point for seconds"""
+        i = int(max(0.0, seconds) / self.resolution)
+        i = min(i, len(self.offsets) - 1)
+        return self.offsets[i], self.times[i]
+
+    def open_at(self, seconds):
+        """Open the track positioned on the indexed frame for seconds
+
+        Returns (file object, time that frame starts playing).
+        """
+        offset, start = self.lookup(seconds)
+        f = open(self.path, "rb")
+        f.seek(offset)
+        return f, start
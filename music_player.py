@@ -5,6 +5,7 @@ import time
 import threading
 from mutagen.mp3 import MP3
 from mutagen.id3 import ID3
+from mp3_index import SeekIndex
 
 class MusicPlayer:
     def __init__(self, on_music_end_callback):
@@ -16,6 +17,12 @@ class MusicPlayer:
         self.stop_flag = False  # Flag to stop playback
         self.is_paused = False  # Track whether the music is paused
         self.skip_song_flag = False  # New flag to handle skipping songs
+        self.track_cache = {}  # Metadata and seek index per song path
+        self.seek_index = None  # Seek index for the current song
+        self.seek_file = None  # File object the current song was loaded from after a seek
+        self.position_offset = 0.0  # Track time (seconds) where the current play() started
+        # Held while the track is reloaded so the play loop doesn't see it as finished
+        self.playback_lock = threading.Lock()
 
     def get_song_metadata(self, song_filename, song):
         """Retrieve metadata from an MP3 file, handling missing metadata safely"""
@@ -38,14 +45,29 @@ class MusicPlayer:
         
         return metadata
 
-    def play_playlist(self, playlist_path, lcd_manager):
-        """Starts playing a playlist in a separate thread"""
+    def get_track_info(self, song_filename, song):
+        """Return cached metadata and seek index for a song, building them on first use"""
+        info = self.track_cache.get(song_filename)
+        if info is None:
+            info = {
+                'metadata': self.get_song_metadata(song_filename, song),
+                'seek_index': SeekIndex.from_file(song_filename)
+            }
+            self.track_cache[song_filename] = info
+        return info
+
+    def play_playlist(self, playlist_path, lcd_manager, on_music_end_callback=None):
+        """Starts playing a playlist in a separate thread
+
+        on_music_end_callback overrides the player's callback for this playlist only.
+        """
+        on_music_end_callback = on_music_end_callback or self.on_music_end_callback
         print(f"DEBUG: Starting playlist from {playlist_path}")
         songs = [f for f in os.listdir(playlist_path) if f.endswith(".mp3")]
         
         if not songs:
             print("DEBUG: No songs found in playlist")
-            self.on_music_end_callback()
+            on_music_end_callback()
             return
 
         print(f"DEBUG: Found {len(songs)} songs, shuffling...")
@@ -55,10 +77,13 @@ class MusicPlayer:
         self.stop_flag = False  # Reset stop flag
         self.is_paused = False  # Reset pause flag
         self.skip_song_flag = False  # Reset skip flag
-        self.play_thread = threading.Thread(target=self._play_songs, args=(songs, playlist_path, lcd_manager))
+        self.play_thread = threading.Thread(
+            target=self._play_songs,
+            args=(songs, playlist_path, lcd_manager, on_music_end_callback)
+        )
         self.play_thread.start()
 
-    def _play_songs(self, songs, playlist_path, lcd_manager):
+    def _play_songs(self, songs, playlist_path, lcd_manager, on_music_end_callback):
         """Plays songs in a separate thread to prevent blocking"""
         for song in songs:
             if self.stop_flag:
@@ -69,16 +94,23 @@ class MusicPlayer:
             # Reset skip flag for each new song
             self.skip_song_flag = False
             song_path = os.path.join(playlist_path, song)
-            self.current_song = song_path  # Store the current song
             print(f"DEBUG: Loading song: {song}")
-            pygame.mixer.music.load(song_path)
-            pygame.mixer.music.play()
+            with self.playback_lock:
+                self.current_song = song_path  # Store the current song
+                self.seek_index = None  # Not built yet for this song; blocks seeks until it is
+                pygame.mixer.music.load(song_path)
+                pygame.mixer.music.play()
+                self._close_seek_file()
+                self.position_offset = 0.0
 
-            metadata = self.get_song_metadata(song_path, song)
-            lcd_manager.display_now_playing(metadata)
+            track_info = self.get_track_info(song_path, song)
+            with self.playback_lock:
+                if self.current_song == song_path:
+                    self.seek_index = track_info['seek_index']
+            lcd_manager.display_now_playing(track_info['metadata'])
 
             # Wait for the song to finish or until playback is stopped or skipped
-            while pygame.mixer.music.get_busy() or self.is_paused:
+            while self._is_song_active():
                 time.sleep(0.1)
                 if self.stop_flag:
                     pygame.mixer.music.stop()
@@ -91,7 +123,18 @@ class MusicPlayer:
                     break  # Break out of the loop to move to the next song
         
         print("DEBUG: Playlist finished - signaling return to menu")
-        self.on_music_end_callback()
+        on_music_end_callback()
+
+    def _is_song_active(self):
+        """Check whether the current song is still playing or paused"""
+        with self.playback_lock:
+            return pygame.mixer.music.get_busy() or self.is_paused
+
+    def _close_seek_file(self):
+        """Close the file object left over from the last seek, if any"""
+        if self.seek_file:
+            self.seek_file.close()
+            self.seek_file = None
 
     def toggle_play_pause(self):
         """Pauses or resumes playback"""
@@ -108,10 +151,56 @@ class MusicPlayer:
         """Rewinds the currently playing song"""
         if self.current_song:
             print("DEBUG: Rewinding song")
-            pygame.mixer.music.stop()
-            pygame.mixer.music.load(self.current_song)
+            with self.playback_lock:
+                pygame.mixer.music.stop()
+                pygame.mixer.music.load(self.current_song)
+                pygame.mixer.music.play()
+                self._close_seek_file()
+                self.position_offset = 0.0
+                self.is_paused = False  # Reset pause state when rewinding
+
+    def get_position(self):
+        """Return the playback position in the current song in seconds"""
+        elapsed = pygame.mixer.music.get_pos()
+        return self.position_offset + max(elapsed, 0) / 1000.0
+
+    def seek(self, delta):
+        """Jumps forward or back by delta seconds using the song's seek index
+
+        The song is reloaded from a Python file object already positioned on
+        the target frame, and keeps playing from it until the next song. SDL
+        then reads through pygame's file-object wrapper, which takes the GIL
+        from the audio callback; that's only safe because MusicPlayer runs in
+        its own process (see audio_process.py) with no UI work competing.
+        """
+        seek_index = self.seek_index
+        if not self.current_song or seek_index is None or seek_index.path != self.current_song:
+            print("DEBUG: Seek unavailable for current song")
+            return
+
+        target = self.get_position() + delta
+        if target >= seek_index.duration:
+            if seek_index.complete:
+                self.skip_song()
+            else:
+                # The index stopped short of the end, so there may still be audio left
+                print("DEBUG: Seek past the end of the indexed audio")
+            return
+
+        seek_file, start = seek_index.open_at(target)
+        with self.playback_lock:
+            if seek_index.path != self.current_song:
+                # The track changed while we were locating the frame
+                seek_file.close()
+                return
+            print(f"DEBUG: Seeking to {start:.1f}s")
+            pygame.mixer.music.load(seek_file, "mp3")
             pygame.mixer.music.play()
-            self.is_paused = False  # Reset pause state when rewinding
+            if self.is_paused:
+                pygame.mixer.music.pause()  # Stay paused while scrubbing
+            self._close_seek_file()
+            self.seek_file = seek_file
+            self.position_offset = start
 
     def skip_song(self):
         """Stops the current song and moves to the next one"""
@@ -126,3 +215,14 @@ class MusicPlayer:
         self.stop_flag = True  # Set flag to stop playback
         pygame.mixer.music.stop()  # Immediately stop playback
         self.is_paused = False  # Reset pause state when stopping
+
+    def set_volume(self, volume):
+        """Sets the playback volume (0.0 to 1.0)"""
+        pygame.mixer.music.set_volume(volume)
+
+    def shutdown(self):
+        """Waits for the playback thread to finish and releases the mixer"""
+        if self.play_thread and self.play_thread.is_alive():
+            self.play_thread.join(timeout=1)
+        self._close_seek_file()
+        pygame.mixer.quit()
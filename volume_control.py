@@ -3,7 +3,7 @@ import time
 import pygame
 
 class VolumeControl:
-    def __init__(self, clk_pin=23, dt_pin=22, sw_pin=27, min_volume=0, max_volume=1.0, step=0.01):
+    def __init__(self, clk_pin=23, dt_pin=22, sw_pin=27, min_volume=0, max_volume=1.0, step=0.01, volume_setter=None):
         # Clean up any previous GPIO setup first
         GPIO.cleanup()
         
@@ -21,12 +21,15 @@ class VolumeControl:
         self.volume_step = step
         self.current_volume = 0.5  # Start at 50% volume
         
-        # Initialize pygame mixer if not already initialized
-        if not pygame.mixer.get_init():
-            pygame.mixer.init()
+        # Where volume changes are sent; defaults to this process's pygame mixer
+        if volume_setter is None:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
+            volume_setter = pygame.mixer.music.set_volume
+        self.volume_setter = volume_setter
         
         # Set initial volume
-        pygame.mixer.music.set_volume(self.current_volume)
+        self.volume_setter(self.current_volume)
         
         # Set up the GPIO pins
         GPIO.setup(self.CLK_PIN, GPIO.IN, pull_up_down=GPIO.PUD_UP)
@@ -72,7 +75,7 @@ class VolumeControl:
         
         # Update if volume changed
         if changed:
-            pygame.mixer.music.set_volume(self.current_volume)
+            self.volume_setter(self.current_volume)
             print(f"DEBUG: Volume changed to {self.current_volume*100:.0f}%")
         
         # Save the current state for next time
@@ -84,16 +87,16 @@ class VolumeControl:
         # Button press detected (0 means pressed with pull-up resistor)
         if current_button_state == 0 and self.last_button_state == 1:
             # Toggle mute
-            if pygame.mixer.music.get_volume() > 0:
+            if self.current_volume > 0:
                 # Store current volume and mute
                 self.stored_volume = self.current_volume
                 self.current_volume = 0
-                pygame.mixer.music.set_volume(0)
+                self.volume_setter(0)
                 print("DEBUG: Audio muted")
             else:
                 # Restore volume
                 self.current_volume = self.stored_volume
-                pygame.mixer.music.set_volume(self.current_volume)
+                self.volume_setter(self.current_volume)
                 print(f"DEBUG: Audio unmuted, volume restored to {self.current_volume*100:.0f}%")
             
             # Add a small delay to avoid multiple detections
@@ -108,7 +111,7 @@ class VolumeControl:
     def set_volume(self, volume):
         """Set volume to a specific level (0.0 to 1.0)"""
         self.current_volume = max(self.min_volume, min(self.max_volume, volume))
-        pygame.mixer.music.set_volume(self.current_volume)
+        self.volume_setter(self.current_volume)
         print(f"DEBUG: Volume set to {self.current_volume*100:.0f}%")
     
     def cleanup(self):